@@ -1,16 +1,94 @@
 """DNS benchmarking engine for performance testing."""
 
+import asyncio
+import itertools
+import logging
+import sys
 import time
-import concurrent.futures
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import numpy as np
+
+import dns.asyncresolver
 import dns.rdatatype
 import dns.resolver
 
+# Default upper bound on concurrently in-flight queries, matching the worker
+# count of the thread pool this engine replaced.
+_DEFAULT_CONCURRENCY = 20
+
+# Exponential backoff between retry attempts, in seconds.
+_BACKOFF_BASE = 0.1
+_BACKOFF_MAX = 2.0
+
+# Cache lifetime used when an answer carries no usable TTL.
+_DEFAULT_CACHE_TTL = 30.0
+
+# Fixed messages for the common resolver failures, keyed by exception type.
+# A single dict probe on type(e) replaces a ladder of except clauses, each
+# of which costs an isinstance check on every miss. Subclasses are resolved
+# through their MRO on first sight and memoized here, so e.g. the
+# dns.resolver.LifetimeTimeout a timed-out resolve actually raises gets the
+# Timeout label after one walk.
+_ERR_MAP = {
+    dns.resolver.NXDOMAIN: "NXDOMAIN: Domain does not exist",
+    dns.resolver.NoAnswer: "NoAnswer: No A record found",
+    dns.exception.Timeout: "Timeout: Query exceeded time limit",
+    dns.resolver.NoNameservers: "NoNameservers: Unable to reach nameserver",
+}
+
+
+def _classify_error(exc: Exception) -> str:
+    """Map a query exception to the user-facing error string."""
+    exc_type = type(exc)
+    error = _ERR_MAP.get(exc_type)
+    if error is not None:
+        return error
+    for base in exc_type.__mro__[1:]:
+        error = _ERR_MAP.get(base)
+        if error is not None:
+            _ERR_MAP[exc_type] = error
+            return error
+    if isinstance(exc, dns.exception.DNSException):
+        return f"DNSException: {str(exc)}"
+    return f"Error: {str(exc)}"
+
+
+def _make_query_fn(resolver: dns.resolver.Resolver):
+    """Build a specialized sync query closure bound to one resolver.
+
+    Everything the timed path touches — the resolve method, the clock,
+    the rdtype and the error classifier — is captured as a default
+    argument, so each call runs on local-variable loads with no
+    attribute traversal between the two clock reads.
+    """
+
+    def query(
+        domain: str,
+        _resolve=resolver.resolve,
+        _pc=time.perf_counter_ns,
+        _rdtype=dns.rdatatype.A,
+        _classify=_classify_error,
+    ) -> tuple[float, bool, Optional[str]]:
+        error: Optional[str] = None
+        start_ns = _pc()
+        try:
+            _resolve(domain, _rdtype)
+        except Exception as e:
+            error = _classify(e)
+        latency_ms = (_pc() - start_ns) / 1_000_000
+        return latency_ms, error is None, error
+
+    return query
+
+
+logger = logging.getLogger("dns_bench")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkResult:
     """Single benchmark result for a DNS query."""
 
@@ -20,6 +98,125 @@ class BenchmarkResult:
     success: bool
     error: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # A run reuses the same handful of provider IPs across thousands
+        # of records; interning makes every copy the same object, so the
+        # string comparisons in the grouping paths short-circuit on
+        # identity instead of hashing and comparing characters. str()
+        # first: sys.intern rejects str subclasses such as numpy's
+        # unicode scalars.
+        object.__setattr__(self, "provider", sys.intern(str(self.provider)))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        providers,
+        domains,
+        latency_ms,
+        success,
+        error=None,
+    ) -> List["BenchmarkResult"]:
+        """
+        Materialize results in bulk from parallel columns.
+
+        Instances are built with __new__ plus direct slot stores, skipping
+        the generated dataclass __init__ and its keyword binding per row;
+        for thousands of records that is the bulk of construction cost.
+
+        Args:
+            providers: Provider IP per record
+            domains: Domain name per record
+            latency_ms: Latency per record in milliseconds
+            success: Success flag per record
+            error: Error message per record (default: None for all)
+
+        Returns:
+            List of BenchmarkResult objects in input order
+        """
+        new = cls.__new__
+        set_slot = object.__setattr__
+        intern = sys.intern
+        if error is None:
+            error = itertools.repeat(None)
+
+        results = []
+        append = results.append
+        for record in zip(providers, domains, latency_ms, success, error):
+            result = new(cls)
+            # str() first: sys.intern only accepts exact str, and columns
+            # often arrive as numpy unicode scalars.
+            set_slot(result, "provider", intern(str(record[0])))
+            set_slot(result, "domain", record[1])
+            set_slot(result, "latency_ms", record[2])
+            set_slot(result, "success", record[3])
+            set_slot(result, "error", record[4])
+            append(result)
+        return results
+
+
+class BenchmarkResults:
+    """
+    Structure-of-arrays view over a batch of benchmark results.
+
+    Packs the per-query fields into parallel NumPy arrays so aggregate
+    statistics run as single vectorized operations instead of Python
+    loops over thousands of result objects.
+    """
+
+    __slots__ = ("providers", "domains", "latency_ms", "success")
+
+    def __init__(self, results: List[BenchmarkResult]) -> None:
+        """
+        Pack a list of results into column arrays.
+
+        Args:
+            results: List of benchmark results from BenchmarkRunner
+        """
+        n = len(results)
+        self.providers = np.fromiter((r.provider for r in results), dtype=object, count=n)
+        self.domains = np.fromiter((r.domain for r in results), dtype=object, count=n)
+        self.latency_ms = np.fromiter((r.latency_ms for r in results), dtype=np.float64, count=n)
+        self.success = np.fromiter((r.success for r in results), dtype=bool, count=n)
+
+    def __len__(self) -> int:
+        return self.latency_ms.size
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Compute aggregate statistics over successful queries.
+
+        Returns:
+            Dict with count, success_rate (percent), and mean/p50/p95/p99
+            latency in milliseconds. Latency keys are 0.0 when no query
+            succeeded.
+        """
+        count = self.latency_ms.size
+        if count == 0:
+            return {
+                "count": 0,
+                "success_rate": 0.0,
+                "mean_latency_ms": 0.0,
+                "p50_latency_ms": 0.0,
+                "p95_latency_ms": 0.0,
+                "p99_latency_ms": 0.0,
+            }
+
+        ok = self.latency_ms[self.success]
+        if ok.size:
+            mean = float(ok.mean())
+            p50, p95, p99 = (float(v) for v in np.percentile(ok, (50.0, 95.0, 99.0)))
+        else:
+            mean = p50 = p95 = p99 = 0.0
+
+        return {
+            "count": count,
+            "success_rate": float(self.success.mean()) * 100,
+            "mean_latency_ms": mean,
+            "p50_latency_ms": p50,
+            "p95_latency_ms": p95,
+            "p99_latency_ms": p99,
+        }
+
 
 class BenchmarkRunner:
     """
@@ -29,12 +226,33 @@ class BenchmarkRunner:
     measuring latency and capturing success/failure information.
     """
 
+    __slots__ = (
+        "providers",
+        "domains",
+        "timeout",
+        "iterations",
+        "retries",
+        "use_cache",
+        "dedupe",
+        "concurrency",
+        "_pairs",
+        "_inflight",
+        "_backoff_table",
+        "_async_resolvers",
+        "_result_cache",
+        "_local",
+    )
+
     def __init__(
         self,
         providers: List[str],
         domains: List[str],
         timeout: float = 5.0,
         iterations: int = 1,
+        retries: int = 0,
+        use_cache: bool = False,
+        dedupe: bool = False,
+        concurrency: int = _DEFAULT_CONCURRENCY,
     ) -> None:
         """
         Initialize BenchmarkRunner.
@@ -44,11 +262,42 @@ class BenchmarkRunner:
             domains: List of domain names to query
             timeout: Query timeout in seconds (default: 5.0)
             iterations: Number of times to query each provider+domain (default: 1)
+            retries: Number of retries per failed query (default: 0)
+            use_cache: Reuse successful answers for repeat (provider, domain)
+                queries within the answer's TTL. Off by default so latency
+                measurements always hit the network; enable it to measure
+                cache-warm behaviour or to cut traffic on repeat runs.
+            dedupe: Collapse concurrent identical (provider, domain)
+                queries onto a single in-flight lookup. Off by default so
+                every iteration is a real sample; useful for warmup passes
+                and health checks.
+            concurrency: Maximum queries in flight at once, for both the
+                async batches in run() and the worker count in run_sync()
+                (default: 20)
         """
         self.providers = providers
         self.domains = domains
         self.timeout = timeout
         self.iterations = iterations
+        self.retries = retries
+        self.use_cache = use_cache
+        self.dedupe = dedupe
+        self.concurrency = concurrency
+        # The provider x domain product is fixed for the runner's lifetime;
+        # materialize it once instead of rebuilding it on every run().
+        self._pairs = tuple(itertools.product(providers, domains))
+        # Retry delays are fully determined by the retry index, so compute
+        # them once instead of re-deriving base * 2**n per retry.
+        self._backoff_table = tuple(
+            min(_BACKOFF_MAX, _BACKOFF_BASE * (1 << r)) for r in range(retries)
+        )
+        # One async resolver per provider for the runner's lifetime; the
+        # event loop is single-threaded, so a plain dict suffices.
+        self._async_resolvers: dict = {}
+        # (provider, domain) -> (expiry_monotonic, result tuple)
+        self._result_cache: dict = {}
+        # (provider, domain) -> in-flight singleflight task
+        self._inflight: dict = {}
         self._local = threading.local()
 
     def _get_resolver(self, provider_ip: str) -> dns.resolver.Resolver:
@@ -69,6 +318,74 @@ class BenchmarkRunner:
 
         return self._local.resolvers[provider_ip]
 
+    def _get_async_resolver(self, provider_ip: str) -> dns.asyncresolver.Resolver:
+        """Get or create the shared async resolver for the provider.
+
+        Building a resolver per query costs an object allocation plus
+        socket churn on every lookup; one instance per provider amortizes
+        that across the whole run.
+        """
+        resolver = self._async_resolvers.get(provider_ip)
+        if resolver is None:
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = [provider_ip]
+            resolver.timeout = self.timeout
+            resolver.lifetime = self.timeout
+            resolver.cache = None
+            self._async_resolvers[provider_ip] = resolver
+        return resolver
+
+    async def _query_dns_async(
+        self, provider_ip: str, domain: str
+    ) -> tuple[float, bool, Optional[str]]:
+        """
+        Perform a single DNS A record query on the event loop.
+
+        Async counterpart of _query_dns; same return contract. When
+        use_cache is set, a successful answer is reused for repeat queries
+        of the same (provider, domain) until its TTL expires. When dedupe
+        is set, concurrent identical queries collapse onto one in-flight
+        lookup (singleflight) and all callers share its result.
+        """
+        if self.use_cache:
+            cached = self._result_cache.get((provider_ip, domain))
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        if not self.dedupe:
+            return await self._resolve_once(provider_ip, domain)
+
+        key = (provider_ip, domain)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve_once(provider_ip, domain))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _, key=key: self._inflight.pop(key, None))
+        return await task
+
+    async def _resolve_once(
+        self, provider_ip: str, domain: str
+    ) -> tuple[float, bool, Optional[str]]:
+        """Issue one timed query against the provider's shared resolver."""
+        resolve = self._get_async_resolver(provider_ip).resolve
+
+        answer = None
+        error: Optional[str] = None
+        start_ns = time.perf_counter_ns()
+        try:
+            answer = await resolve(domain, dns.rdatatype.A)
+        except Exception as e:
+            error = _classify_error(e)
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        result = latency_ms, error is None, error
+        if self.use_cache and error is None:
+            ttl = getattr(getattr(answer, "rrset", None), "ttl", None)
+            if not isinstance(ttl, (int, float)) or ttl <= 0:
+                ttl = _DEFAULT_CACHE_TTL
+            self._result_cache[(provider_ip, domain)] = (time.monotonic() + ttl, result)
+        return result
+
     def _query_dns(self, provider_ip: str, domain: str) -> tuple[float, bool, Optional[str]]:
         """
         Perform a single DNS A record query.
@@ -83,70 +400,235 @@ class BenchmarkRunner:
             - success: True if query succeeded, False otherwise
             - error_message: Error message if query failed, None if successful
         """
-        resolver = self._get_resolver(provider_ip)
+        # Delegate to a per-provider closure (thread-local, like the
+        # resolver it wraps) so the timed region is a single call.
+        fns = getattr(self._local, "query_fns", None)
+        if fns is None:
+            fns = self._local.query_fns = {}
+        query = fns.get(provider_ip)
+        if query is None:
+            query = fns[provider_ip] = _make_query_fn(self._get_resolver(provider_ip))
+        return query(domain)
 
-        start_time = time.perf_counter()
-        try:
-            resolver.resolve(domain, dns.rdatatype.A)
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return latency_ms, True, None
-        except dns.resolver.NXDOMAIN:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return latency_ms, False, "NXDOMAIN: Domain does not exist"
-        except dns.resolver.NoAnswer:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return latency_ms, False, "NoAnswer: No A record found"
-        except dns.exception.Timeout:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return latency_ms, False, "Timeout: Query exceeded time limit"
-        except dns.resolver.NoNameservers:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return latency_ms, False, "NoNameservers: Unable to reach nameserver"
-        except dns.exception.DNSException as e:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return latency_ms, False, f"DNSException: {str(e)}"
-        except Exception as e:
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            return latency_ms, False, f"Error: {str(e)}"
+    async def _run_job(self, provider: str, domain: str) -> tuple:
+        """Run a single query with retry/backoff, returning a raw record tuple.
+
+        Returns (provider, domain, latency_ms, success, error) — the
+        BenchmarkResult field order — so the measurement phase only
+        allocates small tuples; dataclass construction happens in bulk
+        after all queries finish, keeping allocation jitter out of the
+        timed region.
+        """
+        query = self._query_dns_async
+        retries = self.retries
+        backoff_table = self._backoff_table
+
+        attempt = 0
+        while True:
+            try:
+                latency_ms, success, error = await query(provider, domain)
+            except Exception as exc:
+                latency_ms, success, error = 0.0, False, f"Unexpected error: {exc}"
+            if success or attempt >= retries:
+                break
+            await asyncio.sleep(backoff_table[attempt])
+            attempt += 1
+        record = (provider, domain, latency_ms, success, error)
+        # Guarded so disabled runs pay a single level check per measurement
+        # instead of formatting work on the event-loop thread.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("measurement %r", record)
+        return record
+
+    async def _run_async(self) -> List[BenchmarkResult]:
+        """
+        Run all provider + domain combinations on the event loop.
+
+        Jobs are spawned in batches of self.concurrency and each batch is
+        awaited before the next is scheduled: the batch boundary is the
+        concurrency gate, so the loop never holds more than one batch of
+        tasks and no per-job semaphore bookkeeping is needed. Raw record
+        tuples are collected while queries run and materialized into
+        BenchmarkResult objects in one pass at the end.
+        """
+        jobs = (pair for pair in self._pairs for _ in range(self.iterations))
+        records: list = []
+
+        while batch := list(itertools.islice(jobs, self.concurrency)):
+            records.extend(
+                await asyncio.gather(
+                    *(self._run_job(provider, domain) for provider, domain in batch)
+                )
+            )
+
+        return [BenchmarkResult(*record) for record in records]
+
+    async def _run_adaptive_async(
+        self, min_iterations: int, max_iterations: int, ci_target: float
+    ) -> List[BenchmarkResult]:
+        """
+        Sample each pair until its latency confidence interval stabilizes.
+
+        Running mean and variance are maintained with Welford's algorithm;
+        sampling for a pair stops once the 95% CI half-width falls below
+        ci_target as a fraction of the mean (or max_iterations is hit).
+        """
+        results: List[BenchmarkResult] = []
+
+        for provider, domain in self._pairs:
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            while count < max_iterations:
+                record = await self._run_job(provider, domain)
+                results.append(BenchmarkResult(*record))
+
+                latency_ms = record[2]
+                count += 1
+                delta = latency_ms - mean
+                mean += delta / count
+                m2 += delta * (latency_ms - mean)
+
+                if count >= min_iterations and mean > 0:
+                    stderr = (m2 / (count - 1) / count) ** 0.5
+                    if 1.96 * stderr / mean < ci_target:
+                        break
+
+        return results
+
+    def run_adaptive(
+        self,
+        min_iterations: int = 5,
+        max_iterations: int = 100,
+        ci_target: float = 0.05,
+    ) -> List[BenchmarkResult]:
+        """
+        Run benchmarks with per-pair adaptive sample counts.
+
+        Instead of the fixed iterations count used by run(), each
+        (provider, domain) pair is sampled until the 95% confidence
+        interval of its mean latency tightens below ci_target, so stable
+        providers finish in a handful of samples while noisy ones keep
+        sampling up to max_iterations.
+
+        Args:
+            min_iterations: Samples to take before testing convergence (default: 5)
+            max_iterations: Hard cap on samples per pair (default: 100)
+            ci_target: CI half-width threshold as a fraction of the mean
+                (default: 0.05)
+
+        Returns:
+            List of BenchmarkResult objects, one per sample taken.
+        """
+        return asyncio.run(
+            self._run_adaptive_async(min_iterations, max_iterations, ci_target)
+        )
+
+    async def _run_replicated_async(self) -> List[BenchmarkResult]:
+        """
+        Race each domain's query across all providers, keeping the winner.
+
+        For every (domain, iteration) the same query is fired at every
+        provider at once; the first completed success wins and the losing
+        tasks are cancelled, bounding each measurement by the fastest
+        provider rather than any single one.
+        """
+        results: List[BenchmarkResult] = []
+        if not self.providers:
+            # Nothing to race; agree with run(), which yields no results
+            # for an empty provider list.
+            return results
+
+        for domain in self.domains:
+            for _ in range(self.iterations):
+                pending = {
+                    asyncio.ensure_future(self._run_job(provider, domain))
+                    for provider in self.providers
+                }
+                # Keep draining completions until a provider succeeds, so
+                # an instant failure (e.g. a refused query) cannot beat a
+                # slower provider that would have answered.
+                finished: list = []
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    finished.extend(task.result() for task in done)
+                    if any(record[3] for record in finished):
+                        break
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+                # Several tasks may finish in the same loop pass; prefer a
+                # success, then the lowest latency (record fields 3 and 2).
+                winner = min(
+                    finished,
+                    key=lambda record: (not record[3], record[2]),
+                )
+                results.append(BenchmarkResult(*winner))
+
+        return results
+
+    def run_replicated(self) -> List[BenchmarkResult]:
+        """
+        Run benchmarks in fastest-wins mode.
+
+        Unlike run(), which measures every provider independently, this
+        replicates each query across all providers and records only the
+        first reply — one result per (domain, iteration).
+
+        Returns:
+            List of BenchmarkResult objects for the winning providers.
+        """
+        return asyncio.run(self._run_replicated_async())
 
     def run(self) -> List[BenchmarkResult]:
         """
         Run benchmarks for all provider + domain combinations.
 
+        Queries run concurrently on a single asyncio event loop via
+        dnspython's async resolver, batched so at most
+        self.concurrency lookups are in flight at once. With uvloop
+        installed the loop runs on libuv.
+
         Returns:
             List of BenchmarkResult objects containing performance metrics.
         """
-        results: List[BenchmarkResult] = []
+        return asyncio.run(self._run_async())
+
+    def run_sync(self) -> List[BenchmarkResult]:
+        """
+        Run benchmarks on a thread pool instead of the event loop.
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            future_to_meta = {}
-            for provider in self.providers:
-                for domain in self.domains:
-                    for _ in range(self.iterations):
-                        future = executor.submit(self._query_dns, provider, domain)
-                        future_to_meta[future] = (provider, domain)
+        For callers already inside a running event loop (where asyncio.run
+        would fail) or embedding the runner in synchronous code. Queries
+        fan out across at most self.concurrency worker threads, each using
+        the thread-local resolver cache. Retries are not applied on this
+        path.
 
-            for future in concurrent.futures.as_completed(future_to_meta):
-                provider, domain = future_to_meta[future]
+        Returns:
+            List of BenchmarkResult objects containing performance metrics.
+        """
+        jobs = [pair for pair in self._pairs for _ in range(self.iterations)]
+        results: List[BenchmarkResult] = []
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, max(1, len(jobs)))) as pool:
+            futures = [pool.submit(self._query_dns, provider, domain) for provider, domain in jobs]
+            for (provider, domain), future in zip(jobs, futures):
                 try:
                     latency_ms, success, error = future.result()
-                    result = BenchmarkResult(
+                except Exception as exc:
+                    latency_ms, success, error = 0.0, False, f"Unexpected error: {exc}"
+                results.append(
+                    BenchmarkResult(
                         provider=provider,
                         domain=domain,
                         latency_ms=latency_ms,
                         success=success,
                         error=error,
                     )
-                    results.append(result)
-                except Exception as exc:
-                    result = BenchmarkResult(
-                        provider=provider,
-                        domain=domain,
-                        latency_ms=0.0,
-                        success=False,
-                        error=f"Unexpected error: {exc}",
-                    )
-                    results.append(result)
+                )
 
         return results
 
@@ -156,6 +638,7 @@ def run_benchmark(
     domains: List[str],
     timeout: float = 5.0,
     iterations: int = 1,
+    retries: int = 0,
 ) -> List[BenchmarkResult]:
     """
     Convenience function to run benchmarks.
@@ -165,6 +648,7 @@ def run_benchmark(
         domains: List of domain names to query
         timeout: Query timeout in seconds (default: 5.0)
         iterations: Number of times to query each provider+domain (default: 1)
+        retries: Number of retries per failed query (default: 0)
 
     Returns:
         List of BenchmarkResult objects
@@ -174,5 +658,6 @@ def run_benchmark(
         domains=domains,
         timeout=timeout,
         iterations=iterations,
+        retries=retries,
     )
     return runner.run()
@@ -1,19 +1,42 @@
 """CLI entry point for DNS Benchmark tool."""
 
-from pathlib import Path
+import sys
 
 import click
 from rich.console import Console
 from rich.table import Table
 
 from dns_bench import __version__
-from dns_bench.benchmark import run_benchmark
-from dns_bench.config.loader import ConfigLoader
-from dns_bench.core.di import ServiceContainer
-from dns_bench.results import display_results
+
+# The benchmark, results, and config modules pull in dnspython, numpy,
+# and msgspec. They are imported inside the commands that need them so
+# invocations like `dns-bench --help` and `dns-bench version` never pay
+# that import cost.
 
 console = Console()
 
+# Options resolved by the group callback, read directly by subcommands.
+# A plain module dict skips Click's Context.ensure_object/ctx.obj plumbing
+# on every invocation; the process runs exactly one command, so there is
+# no state to isolate.
+_STATE: dict = {}
+
+
+def _install_uvloop() -> None:
+    """Install the uvloop event loop policy when available.
+
+    uvloop is an optional dependency (not available on Windows); any asyncio
+    event loop created afterwards in this process runs on libuv instead of
+    the stdlib selector loop.
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
 
 @click.group()
 @click.version_option(
@@ -34,39 +57,55 @@ console = Console()
     is_flag=True,
     help="Enable verbose output",
 )
-@click.pass_context
-def app(ctx: click.Context, config: str, verbose: bool) -> None:
+def app(config: str, verbose: bool) -> None:
     """DNS Benchmark Tool - Benchmark and analyze DNS resolver performance."""
-    ctx.ensure_object(dict)
-    ctx_obj = ctx.obj  # type: ignore
+    # Only record the options here; the config file is loaded lazily by
+    # _get_config() so commands that never read it (version) skip the
+    # loader import and the filesystem entirely.
+    _STATE["verbose"] = verbose
+    _STATE["config_path"] = config
 
-    try:
-        config_path = Path(config)
-        if config_path.exists():
-            config_loader = ConfigLoader()
-            loaded_config = config_loader.load(str(config_path))
 
-            container = ServiceContainer(loaded_config)
-            ctx_obj["container"] = container
-            ctx_obj["config"] = loaded_config
-            ctx_obj["verbose"] = verbose
+def _get_config():
+    """Load the configured file on first use, caching the outcome.
 
-            if verbose:
-                console.print("[bold cyan]DNS Benchmark initialized[/bold cyan]")
-                console.print(f"Config: {config}")
-        elif verbose:
-            console.print(f"[yellow]Warning: Configuration file not found: {config}[/yellow]")
-            ctx_obj["verbose"] = verbose
-        else:
-            ctx_obj["verbose"] = verbose
+    Returns the parsed Config, or None if the file does not exist (with
+    a warning in verbose mode). Any other load failure reports the error
+    and exits, matching the CLI's error style.
+    """
+    if "config" in _STATE:
+        return _STATE["config"]
+
+    verbose = _STATE.get("verbose", False)
+    config_path = _STATE.get("config_path", "config/config.yaml")
+
+    try:
+        from dns_bench.config.loader import load_config
+        from dns_bench.core.di import ServiceContainer
+
+        loaded_config = load_config(config_path)
+    except FileNotFoundError:
+        if verbose:
+            console.print(
+                f"[yellow]Warning: Configuration file not found: {config_path}[/yellow]"
+            )
+        _STATE["config"] = None
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {str(e)}")
-        raise click.Exit(code=1)  # type: ignore
+        raise SystemExit(1)
+    else:
+        _STATE["container"] = ServiceContainer(loaded_config)
+        _STATE["config"] = loaded_config
+
+        if verbose:
+            console.print("[bold cyan]DNS Benchmark initialized[/bold cyan]")
+            console.print(f"Config: {config_path}")
+
+    return _STATE["config"]
 
 
 @app.command()
-@click.pass_context
-def version(ctx: click.Context) -> None:
+def version() -> None:
     """Display version information."""
     console.print(f"DNS Benchmark v{__version__}")
 
@@ -100,29 +139,42 @@ def version(ctx: click.Context) -> None:
     default=5.0,
     help="Query timeout in seconds",
 )
-@click.pass_context
+@click.option(
+    "--retries",
+    "-r",
+    type=int,
+    default=0,
+    help="Number of retries per failed query",
+)
+@click.option(
+    "--output",
+    "-o",
+    default=None,
+    type=click.Path(),
+    help="Write raw results to a .json or .csv file",
+)
 def run(
-    ctx: click.Context,
     providers: tuple,
     domains: tuple,
     iterations: int,
     timeout: float,
+    retries: int,
+    output: str,
 ) -> None:
     """Run DNS benchmarks."""
-    ctx_obj = ctx.obj or {}
-    verbose = ctx_obj.get("verbose", False)
+    verbose = _STATE.get("verbose", False)
 
     providers_list = list(providers)
     domains_list = list(domains)
 
     if not providers_list or not domains_list:
-        config = ctx_obj.get("config")
+        config = _get_config()
         if config:
             providers_list = [p.primary_ip for p in config.providers] or providers_list
             domains_list = [d.name for d in config.domains] or domains_list
         else:
             console.print("[bold red]Error:[/bold red] No providers or domains specified")
-            raise click.Exit(code=1)  # type: ignore
+            raise SystemExit(1)
 
     if verbose:
         console.print(
@@ -130,17 +182,29 @@ def run(
             f"and {len(domains_list)} domain(s), {iterations} iteration(s) each[/cyan]"
         )
 
+    _install_uvloop()
+
+    from dns_bench.benchmark import run_benchmark
+    from dns_bench.exporters import export_results
+    from dns_bench.results import display_results
+
     try:
         results = run_benchmark(
             providers=providers_list,
             domains=domains_list,
             timeout=timeout,
             iterations=iterations,
+            retries=retries,
         )
 
         if results:
             display_results(results, console=console)
 
+            if output:
+                export_results(results, output)
+                if verbose:
+                    console.print(f"[green]Results written to {output}[/green]")
+
             if verbose:
                 console.print()
                 console.print(f"[green]Completed {len(results)} total queries[/green]")
@@ -151,7 +215,7 @@ def run(
             import traceback
 
             traceback.print_exc()
-        raise click.Exit(code=1)  # type: ignore
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -1,17 +1,26 @@
 """Dependency injection container for DNS Benchmark."""
 
-from typing import Any, Optional
+from typing import Any
 
 from dns_bench.config.models import Config
 
+# Sentinel marking a singleton entry whose instance has not been built yet;
+# distinct from None so a factory may legitimately return None.
+_MISSING = object()
+
 
 class ServiceContainer:
     """
     Service container for dependency injection.
 
     Manages dependencies and their lifecycle throughout the application.
+    Each registration is a single ``[service, singleton, cached]`` entry,
+    so lookups do one dict probe instead of separate membership checks
+    against parallel service/singleton dicts.
     """
 
+    __slots__ = ("config", "_entries")
+
     def __init__(self, config: Config) -> None:
         """
         Initialize service container with configuration.
@@ -20,8 +29,7 @@ class ServiceContainer:
             config: DNS Benchmark configuration
         """
         self.config = config
-        self._services: dict[str, Any] = {}
-        self._singletons: dict[str, Any] = {}
+        self._entries: dict[str, list] = {}
 
     def register(self, name: str, service: Any, singleton: bool = False) -> None:
         """
@@ -32,9 +40,7 @@ class ServiceContainer:
             service: Service instance or factory function
             singleton: Whether to cache the service instance
         """
-        self._services[name] = service
-        if singleton:
-            self._singletons[name] = None
+        self._entries[name] = [service, singleton, _MISSING]
 
     def get(self, name: str) -> Any:
         """
@@ -49,18 +55,17 @@ class ServiceContainer:
         Raises:
             KeyError: If service not registered
         """
-        if name not in self._services:
+        entry = self._entries.get(name)
+        if entry is None:
             raise KeyError(f"Service '{name}' not registered in container")
 
-        if name in self._singletons:
-            if self._singletons[name] is None:
-                service_factory = self._services[name]
-                self._singletons[name] = (
-                    service_factory() if callable(service_factory) else service_factory
-                )
-            return self._singletons[name]
+        service, singleton, cached = entry
+        if singleton:
+            if cached is _MISSING:
+                cached = service() if callable(service) else service
+                entry[2] = cached
+            return cached
 
-        service = self._services[name]
         return service() if callable(service) else service
 
     def has(self, name: str) -> bool:
@@ -73,9 +78,8 @@ class ServiceContainer:
         Returns:
             True if service is registered
         """
-        return name in self._services
+        return name in self._entries
 
     def clear(self) -> None:
         """Clear all registered services."""
-        self._services.clear()
-        self._singletons.clear()
+        self._entries.clear()
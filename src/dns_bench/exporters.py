@@ -0,0 +1,101 @@
+"""Export benchmark results to JSON and CSV files."""
+
+import csv
+import json
+from operator import attrgetter
+from pathlib import Path
+from typing import List, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the extra is absent
+    orjson = None
+
+try:
+    from msgspec import json as msgspec_json
+except ImportError:  # pragma: no cover - msgspec ships with the package
+    msgspec_json = None
+
+from dns_bench.benchmark import BenchmarkResult
+
+_FIELDS = ("provider", "domain", "latency_ms", "success", "error")
+_ROW = attrgetter(*_FIELDS)
+
+
+def export_csv(results: List[BenchmarkResult], path: Union[str, Path]) -> None:
+    """
+    Write benchmark results to a CSV file.
+
+    Rows are streamed directly from the result fields through a single
+    precomputed attrgetter, so no intermediate per-row dicts are built
+    and each row is one C-level call.
+
+    Args:
+        results: List of benchmark results to export
+        path: Destination file path
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(_FIELDS)
+        writer.writerows(map(_ROW, results))
+
+
+def export_json(results: List[BenchmarkResult], path: Union[str, Path]) -> None:
+    """
+    Write benchmark results to a JSON file.
+
+    Records are serialized and written one at a time instead of
+    materializing the full payload list plus its serialized form in
+    memory, so peak memory stays flat for large runs. Serialization
+    prefers orjson (C-implemented, installed via the "fast" extra), then
+    msgspec's C encoder, then stdlib json.
+
+    Args:
+        results: List of benchmark results to export
+        path: Destination file path
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    elif msgspec_json is not None:
+        dumps = msgspec_json.encode
+    else:
+        dumps = lambda record: json.dumps(record).encode()  # noqa: E731
+
+    with open(path, "wb") as f:
+        f.write(b"[")
+        first = True
+        for r in results:
+            f.write(b"\n  " if first else b",\n  ")
+            f.write(
+                dumps(
+                    {
+                        "provider": r.provider,
+                        "domain": r.domain,
+                        "latency_ms": r.latency_ms,
+                        "success": r.success,
+                        "error": r.error,
+                    }
+                )
+            )
+            first = False
+        f.write(b"]" if first else b"\n]")
+
+
+def export_results(results: List[BenchmarkResult], path: Union[str, Path]) -> None:
+    """
+    Export results to the format implied by the file extension.
+
+    Args:
+        results: List of benchmark results to export
+        path: Destination file path (.json or .csv)
+
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".json":
+        export_json(results, path)
+    elif suffix == ".csv":
+        export_csv(results, path)
+    else:
+        raise ValueError(f"Unsupported export format: {suffix or path}. Use .json or .csv")
@@ -1,29 +1,58 @@
 """Cross-platform DNS resolver detection utility."""
 
-import platform
 import re
-import subprocess
-from ipaddress import AddressValueError, ip_address
+import socket
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
+from typing import List, Optional, Tuple
 
-_WINDOWS_DNS_PATTERN = re.compile(r"DNS Servers.*?:\s*(.+)", re.IGNORECASE)
+# "DNS Servers ... : <ip>" plus any indented IP-looking continuation lines.
+_WINDOWS_DNS_PATTERN = re.compile(
+    rb"DNS Servers[^:\r\n]*:\s*(\S+)((?:\r?\n[ \t]+[0-9A-Fa-f.:%]+[ \t]*)*)",
+    re.IGNORECASE,
+)
+# "nameserver[0] : <ip>" entries in scutil --dns output.
+_SCUTIL_DNS_PATTERN = re.compile(rb"nameserver\[\d+\]\s*:\s*(\S+)")
+_RESOLV_CONF_PATTERN = re.compile(r"^nameserver\s+(\S+)", re.MULTILINE)
 
+# How long cached detection results stay fresh on platforms where the only
+# invalidation signal would be re-running the subprocess itself.
+_CACHE_TTL = 5.0
 
+
+@lru_cache(maxsize=256)
 def _is_valid_ip(ip: str) -> bool:
     """
     Validate if a string is a valid IPv4 or IPv6 address.
 
+    Results are memoized: the same handful of resolver IPs show up on
+    every detection pass, so repeat validations become a dict hit.
+
     Args:
         ip: IP address string to validate
 
     Returns:
         True if valid IP address, False otherwise
     """
+    # socket.inet_pton parses in C without constructing an ipaddress
+    # object. It is stricter than ip_address() for IPv6 — zone-scoped
+    # addresses (fe80::1%eth0), which ipconfig routinely reports for
+    # site-/link-local DNS servers, are rejected — so the scope id is
+    # split off before the v6 check, matching what ip_address() accepts.
+    try:
+        socket.inet_pton(socket.AF_INET, ip)
+        return True
+    except OSError:
+        pass
+    addr, sep, zone = ip.partition("%")
+    if sep and not zone:
+        return False
     try:
-        ip_address(ip)
+        socket.inet_pton(socket.AF_INET6, addr)
         return True
-    except (AddressValueError, ValueError):
+    except OSError:
         return False
 
 
@@ -39,15 +68,12 @@ def _parse_linux_resolvers() -> List[str]:
 
     try:
         if resolv_conf.exists():
+            # One multiline regex pass over the whole file beats the
+            # per-line strip/startswith/split loop; resolv.conf is tiny.
             with open(resolv_conf, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith("nameserver"):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            ip = parts[1]
-                            if _is_valid_ip(ip):
-                                resolvers.append(ip)
+                for ip in _RESOLV_CONF_PATTERN.findall(f.read()):
+                    if _is_valid_ip(ip):
+                        resolvers.append(ip)
     except (OSError, IOError, PermissionError):
         pass
 
@@ -61,26 +87,28 @@ def _parse_macos_resolvers() -> List[str]:
     Returns:
         List of DNS resolver IP addresses
     """
+    # Imported here so the Linux path (the common case) never loads subprocess.
+    import subprocess
+
     resolvers = []
 
     try:
+        # Keep stdout as bytes: scanning raw bytes avoids decoding the whole
+        # multi-kilobyte output, and only candidate IPs are decoded below.
         result = subprocess.run(
             ["scutil", "--dns"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5,
             check=False,
         )
 
         if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                line = line.strip()
-                if "nameserver" in line.lower():
-                    parts = line.split(":", 1)
-                    if len(parts) >= 2:
-                        ip = parts[1].strip()
-                        if _is_valid_ip(ip):
-                            resolvers.append(ip)
+            # One findall over the whole output instead of a per-line scan.
+            for match in _SCUTIL_DNS_PATTERN.findall(result.stdout):
+                ip = match.decode("ascii", "replace")
+                if _is_valid_ip(ip):
+                    resolvers.append(ip)
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
         pass
 
@@ -94,28 +122,27 @@ def _parse_windows_resolvers() -> List[str]:
     Returns:
         List of DNS resolver IP addresses
     """
+    import subprocess
+
     resolvers = []
 
     try:
+        # As above, operate on raw bytes and decode only candidate IPs.
         result = subprocess.run(
             ["ipconfig", "/all"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=5,
             check=False,
         )
 
         if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                match = _WINDOWS_DNS_PATTERN.search(line)
-                if match:
-                    ip = match.group(1).strip()
-                    if _is_valid_ip(ip):
-                        resolvers.append(ip)
-                elif line.strip() and not line.startswith(" ") and ":" not in line:
-                    continue
-                elif line.strip() and resolvers:
-                    ip = line.strip()
+            # Each match captures the IP on the "DNS Servers" line plus the
+            # block of indented continuation IPs under it, replacing the old
+            # stateful line-by-line walk with one pass over the output.
+            for first, continuation in _WINDOWS_DNS_PATTERN.findall(result.stdout):
+                for candidate in (first, *continuation.split()):
+                    ip = candidate.decode("ascii", "replace")
                     if _is_valid_ip(ip):
                         resolvers.append(ip)
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
@@ -134,15 +161,29 @@ def _deduplicate_resolvers(resolvers: List[str]) -> List[str]:
     Returns:
         List of unique IP addresses in original order
     """
-    seen: Set[str] = set()
-    unique_resolvers = []
+    # dict preserves insertion order, so this dedupes in one C-level pass.
+    return list(dict.fromkeys(resolvers))
 
-    for resolver in resolvers:
-        if resolver not in seen:
-            seen.add(resolver)
-            unique_resolvers.append(resolver)
 
-    return unique_resolvers
+@lru_cache(maxsize=8)
+def _detect_resolvers(system: str, cache_key: Optional[int]) -> Tuple[str, ...]:
+    """
+    Run platform-specific detection, memoized on its cache key.
+
+    On Linux the key is /etc/resolv.conf's mtime, so edits to the file
+    (e.g. by a VPN client) invalidate the entry; on the subprocess
+    platforms it is the current _CACHE_TTL-sized time bucket, so the
+    scutil/ipconfig spawn repeats at most once per TTL window.
+    """
+    if system == "linux":
+        resolvers = _parse_linux_resolvers()
+    elif system == "darwin":
+        resolvers = _parse_macos_resolvers()
+    elif system == "windows":
+        resolvers = _parse_windows_resolvers()
+    else:
+        resolvers = []
+    return tuple(resolvers)
 
 
 def get_local_resolvers() -> List[str]:
@@ -157,6 +198,11 @@ def get_local_resolvers() -> List[str]:
     All detected IPs are validated (IPv4 and IPv6) and deduplicated.
     If detection fails or no resolvers are found, returns ['127.0.0.1'] as fallback.
 
+    Detection results are cached per process (keyed by platform and, on
+    Linux, /etc/resolv.conf's mtime), so repeated calls skip the file and
+    subprocess work. Call ``get_local_resolvers.cache_clear()`` to force
+    re-detection.
+
     Returns:
         List of DNS resolver IP addresses as strings
 
@@ -165,17 +211,34 @@ def get_local_resolvers() -> List[str]:
         >>> print(resolvers)
         ['8.8.8.8', '1.1.1.1']
     """
-    resolvers = []
+    resolvers: List[str] = []
 
     try:
-        system = platform.system().lower()
-
+        # sys.platform is a compile-time constant, so dispatching on it is a
+        # couple of string compares instead of a platform.system() call (which
+        # funnels through uname() and a lowercase normalization) per lookup.
+        if sys.platform.startswith("linux"):
+            system = "linux"
+        elif sys.platform == "darwin":
+            system = "darwin"
+        elif sys.platform in ("win32", "cygwin"):
+            system = "windows"
+        else:
+            system = sys.platform
+
+        cache_key: Optional[int] = None
         if system == "linux":
-            resolvers = _parse_linux_resolvers()
-        elif system == "darwin":
-            resolvers = _parse_macos_resolvers()
-        elif system == "windows":
-            resolvers = _parse_windows_resolvers()
+            try:
+                cache_key = Path("/etc/resolv.conf").stat().st_mtime_ns
+            except OSError:
+                pass
+        else:
+            # No config file to key on; expire entries every _CACHE_TTL
+            # seconds so stale subprocess results bound how long a DNS
+            # change goes unnoticed.
+            cache_key = int(time.monotonic() / _CACHE_TTL)
+
+        resolvers = list(_detect_resolvers(system, cache_key))
     except Exception:
         pass
 
@@ -185,3 +248,6 @@ def get_local_resolvers() -> List[str]:
         resolvers = ["127.0.0.1"]
 
     return resolvers
+
+
+get_local_resolvers.cache_clear = _detect_resolvers.cache_clear  # type: ignore[attr-defined]
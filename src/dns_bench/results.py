@@ -1,17 +1,41 @@
 """Results analysis and display module for DNS benchmarks."""
 
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from dns_bench.benchmark import BenchmarkResult
 
+# Latency colour bands for the results table. Styling cells as Text with an
+# explicit style skips Rich's markup parser on every row.
+_LATENCY_FAST_MS = 50
+_LATENCY_OK_MS = 100
+_STYLE_FAST = "green"
+_STYLE_OK = "yellow"
+_STYLE_SLOW = "red"
 
-@dataclass
+
+def _median(values: np.ndarray) -> float:
+    """
+    Median of a float64 array via an O(N) partial sort.
+
+    np.partition runs a C quickselect around the middle element(s)
+    instead of the full O(N log N) sort np.median can fall back to.
+    """
+    k = values.size // 2
+    if values.size % 2:
+        return float(np.partition(values, k)[k])
+    partitioned = np.partition(values, (k - 1, k))
+    return float(partitioned[k - 1] + partitioned[k]) / 2
+
+
+@dataclass(slots=True, frozen=True)
 class ProviderMetrics:
     """Metrics for a single DNS provider."""
 
@@ -38,6 +62,51 @@ class ResultsAnalyzer:
             results: List of benchmark results from BenchmarkRunner
         """
         self.results = results
+        self._columns: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        # provider -> sorted successful latencies, built on first use so
+        # repeat percentile queries skip the sort.
+        self._sorted_cache: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_columns(
+        cls,
+        providers: np.ndarray,
+        latency_ms: np.ndarray,
+        success: np.ndarray,
+    ) -> "ResultsAnalyzer":
+        """
+        Build an analyzer directly from column arrays.
+
+        Callers that already hold columnar data (e.g. BenchmarkResults)
+        skip materializing a list of BenchmarkResult objects only for the
+        analyzer to unpack them again row by row.
+
+        Args:
+            providers: Provider IP per query (object array)
+            latency_ms: Latency per query in milliseconds (float64 array)
+            success: Success flag per query (bool array)
+
+        Returns:
+            ResultsAnalyzer backed by the given columns
+        """
+        analyzer = cls([])
+        analyzer._columns = (
+            np.asarray(providers, dtype=object),
+            np.asarray(latency_ms, dtype=np.float64),
+            np.asarray(success, dtype=bool),
+        )
+        return analyzer
+
+    def _get_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (providers, latency_ms, success) arrays, packing once."""
+        if self._columns is None:
+            n = len(self.results)
+            self._columns = (
+                np.fromiter((r.provider for r in self.results), dtype=object, count=n),
+                np.fromiter((r.latency_ms for r in self.results), dtype=np.float64, count=n),
+                np.fromiter((r.success for r in self.results), dtype=bool, count=n),
+            )
+        return self._columns
 
     def analyze(self) -> List[ProviderMetrics]:
         """
@@ -46,57 +115,133 @@ class ResultsAnalyzer:
         Returns:
             List of ProviderMetrics sorted by average latency (fastest first)
         """
-        if not self.results:
+        # Grouping happens at the C level: unique() assigns each provider
+        # an integer code, and argsort + split over the codes yields one
+        # contiguous latency and success slice per provider. All
+        # reductions after that are single vectorized calls instead of
+        # per-row Python dict work.
+        providers, latencies, success = self._get_columns()
+        if providers.size == 0:
             return []
 
-        df = pd.DataFrame(
-            {
-                "provider": [r.provider for r in self.results],
-                "latency_ms": [r.latency_ms for r in self.results],
-                "success": [r.success for r in self.results],
-            }
-        )
+        # Single-provider runs skip the coding, grouping, and ordering
+        # machinery entirely: the whole column is the one group.
+        if (providers == providers[0]).all():
+            return [
+                ProviderMetrics(
+                    provider=str(providers[0]),
+                    avg_latency=float(latencies.mean()),
+                    median_latency=_median(latencies),
+                    success_rate=float(success.mean()) * 100,
+                    sample_count=int(latencies.size),
+                )
+            ]
 
-        grouped = df.groupby("provider").agg(
-            avg_latency=("latency_ms", "mean"),
-            median_latency=("latency_ms", "median"),
-            success_count=("success", "sum"),
-            total_count=("success", "count"),
-        )
+        names, codes = np.unique(providers, return_inverse=True)
 
-        metrics_list = []
-        for row in grouped.itertuples():
-            metrics = ProviderMetrics(
-                provider=str(row.Index),
-                avg_latency=float(row.avg_latency),
-                median_latency=float(row.median_latency),
-                success_rate=(row.success_count / row.total_count) * 100,
-                sample_count=int(row.total_count),
+        # Means and success rates fall out of three bincount passes over
+        # the code array — one C-level scan each for counts, latency sums,
+        # and success counts — with no per-group slicing at all.
+        counts = np.bincount(codes)
+        avg = np.bincount(codes, weights=latencies) / counts
+        success_rate = 100.0 * np.bincount(codes, weights=success) / counts
+
+        # Only the median still needs each provider's samples as a
+        # contiguous slice, obtained by sorting on the codes once.
+        order = np.argsort(codes, kind="stable")
+        boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+        latency_groups = np.split(latencies[order], boundaries)
+
+        medians = [_median(values) for values in latency_groups]
+
+        # Order by mean latency with one C sort over the float64 averages
+        # rather than a Python sort dispatching an attribute-access lambda
+        # per comparison; stable so ties keep the provider-name order.
+        result_order = np.argsort(avg, kind="stable")
+        return [
+            ProviderMetrics(
+                provider=str(names[i]),
+                avg_latency=float(avg[i]),
+                median_latency=medians[i],
+                success_rate=float(success_rate[i]),
+                sample_count=int(counts[i]),
             )
-            metrics_list.append(metrics)
+            for i in result_order
+        ]
 
-        metrics_list.sort(key=lambda m: m.avg_latency)
-        return metrics_list
+    def percentile(self, provider: str, q: float) -> float:
+        """
+        Latency percentile for one provider over its successful queries.
 
+        The provider's successful latencies are sorted once and cached on
+        the analyzer, so repeat queries — p50 then p95 then p99, or the
+        same percentile across display passes — skip the sort and only
+        pay for the cheap percentile lookup. Uses the same linear
+        interpolation as latency_percentiles(), so the two methods agree
+        on identical data.
 
-def display_results(results: List[BenchmarkResult], console: Optional[Console] = None) -> None:
-    """
-    Display benchmark results in a formatted table with summary.
+        Args:
+            provider: DNS provider IP address
+            q: Percentile to compute, 0-100
 
-    Args:
-        results: List of raw benchmark results from BenchmarkRunner
-        console: Optional Rich Console instance (creates new one if not provided)
-    """
-    if console is None:
-        console = Console()
+        Returns:
+            Latency in milliseconds at the requested percentile
 
-    if not results:
-        console.print("[yellow]No results to display[/yellow]")
-        return
+        Raises:
+            ValueError: If the provider has no successful samples
+        """
+        values = self._sorted_cache.get(provider)
+        if values is None:
+            providers, latencies, success = self._get_columns()
+            mask = (providers == provider) & success
+            values = np.sort(latencies[mask])
+            self._sorted_cache[provider] = values
 
-    analyzer = ResultsAnalyzer(results)
-    metrics = analyzer.analyze()
+        if values.size == 0:
+            raise ValueError(f"No successful samples for provider: {provider}")
+        return float(np.percentile(values, q))
+
+    def latency_percentiles(
+        self, percentiles: Tuple[float, ...] = (50.0, 95.0, 99.0)
+    ) -> Dict[str, Dict[float, float]]:
+        """
+        Compute latency percentiles per provider over successful queries.
+
+        Latencies are packed into a contiguous float64 array once and each
+        percentile set is computed with a single vectorized np.percentile
+        call, rather than sorting Python lists per provider.
+
+        Args:
+            percentiles: Percentiles to compute (default: p50, p95, p99)
+
+        Returns:
+            Mapping of provider -> {percentile: latency_ms}. Providers with
+            no successful samples are omitted.
+        """
+        providers, latencies, success = self._get_columns()
+        if providers.size == 0:
+            return {}
 
+        summary: Dict[str, Dict[float, float]] = {}
+        for provider in np.unique(providers):
+            mask = (providers == provider) & success
+            if not mask.any():
+                continue
+            values = np.percentile(latencies[mask], percentiles)
+            summary[str(provider)] = dict(zip(percentiles, (float(v) for v in values)))
+        return summary
+
+
+@lru_cache(maxsize=64)
+def _build_table(metrics: Tuple[ProviderMetrics, ...]) -> Table:
+    """
+    Build the results table for a metrics tuple, memoized on its value.
+
+    ProviderMetrics is frozen and therefore hashable, so identical result
+    sets (common when a run is displayed more than once) reuse the
+    constructed Table instead of repeating the per-row build work.
+    Rendering to a specific console still happens per call.
+    """
     table = Table(title="DNS Provider Performance Analysis")
     table.add_column("Provider IP", style="cyan", justify="left")
     table.add_column("Avg Latency (ms)", justify="right")
@@ -104,21 +249,42 @@ def display_results(results: List[BenchmarkResult], console: Optional[Console] =
     table.add_column("Tests Performed", justify="right", style="dim")
 
     for metric in metrics:
-        if metric.avg_latency < 50:
-            latency_style = "green"
-        elif metric.avg_latency < 100:
-            latency_style = "yellow"
+        if metric.avg_latency < _LATENCY_FAST_MS:
+            latency_style = _STYLE_FAST
+        elif metric.avg_latency < _LATENCY_OK_MS:
+            latency_style = _STYLE_OK
         else:
-            latency_style = "red"
+            latency_style = _STYLE_SLOW
 
         table.add_row(
             metric.provider,
-            f"[{latency_style}]{metric.avg_latency:.2f}[/{latency_style}]",
+            Text(f"{metric.avg_latency:.2f}", style=latency_style),
             f"{metric.success_rate:.1f}%",
             str(metric.sample_count),
         )
 
-    console.print(table)
+    return table
+
+
+def display_results(results: List[BenchmarkResult], console: Optional[Console] = None) -> None:
+    """
+    Display benchmark results in a formatted table with summary.
+
+    Args:
+        results: List of raw benchmark results from BenchmarkRunner
+        console: Optional Rich Console instance (creates new one if not provided)
+    """
+    if console is None:
+        console = Console()
+
+    if not results:
+        console.print("[yellow]No results to display[/yellow]")
+        return
+
+    analyzer = ResultsAnalyzer(results)
+    metrics = analyzer.analyze()
+
+    console.print(_build_table(tuple(metrics)))
 
     fastest = metrics[0]
     most_reliable = max(metrics, key=lambda m: m.success_rate)
@@ -133,3 +299,10 @@ def display_results(results: List[BenchmarkResult], console: Optional[Console] =
         f"  • Most reliable provider: [cyan]{most_reliable.provider}[/cyan] "
         f"({most_reliable.success_rate:.1f}% success rate)"
     )
+
+    fastest_percentiles = analyzer.latency_percentiles().get(fastest.provider)
+    if fastest_percentiles:
+        console.print(
+            f"  • Fastest provider p95: {fastest_percentiles[95.0]:.2f}ms "
+            f"(p99: {fastest_percentiles[99.0]:.2f}ms)"
+        )
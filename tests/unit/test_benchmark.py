@@ -1,11 +1,43 @@
 """Tests for benchmarking engine."""
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
 
 import dns.exception
 import dns.resolver
 
-from dns_bench.benchmark import BenchmarkResult, BenchmarkRunner, run_benchmark
+from dns_bench.benchmark import (
+    BenchmarkResult,
+    BenchmarkResults,
+    BenchmarkRunner,
+    run_benchmark,
+)
+
+
+class FakeResolver:
+    """
+    Minimal stand-in for dns.resolver.Resolver in the sync query tests.
+
+    One plain class shared via @patch(..., new=FakeResolver) avoids
+    building a fresh reflection-heavy MagicMock graph per test; each test
+    sets `raises` to choose the resolve() outcome.
+    """
+
+    raises = None
+
+    def __init__(self, configure=True):
+        self.nameservers = []
+        self.timeout = None
+        self.lifetime = None
+        self.cache = None
+
+    def resolve(self, domain, rdtype):
+        if FakeResolver.raises is not None:
+            raise FakeResolver.raises
+        return None
 
 
 class TestBenchmarkResult:
@@ -41,6 +73,104 @@ class TestBenchmarkResult:
         assert result.success is False
         assert result.error == "Timeout: Query exceeded time limit"
 
+    def test_benchmark_result_accepts_str_subclass_provider(self):
+        """Test that str subclasses (e.g. numpy scalars) intern cleanly."""
+        result = BenchmarkResult(
+            provider=np.str_("8.8.8.8"),
+            domain="google.com",
+            latency_ms=45.5,
+            success=True,
+            error=None,
+        )
+        assert result.provider == "8.8.8.8"
+        assert type(result.provider) is str
+
+    def test_from_arrays_matches_constructor(self):
+        """Test bulk construction from parallel columns."""
+        results = BenchmarkResult.from_arrays(
+            providers=["8.8.8.8", "1.1.1.1"],
+            domains=["google.com", "invalid.test"],
+            latency_ms=[45.5, 0.0],
+            success=[True, False],
+            error=[None, "Timeout: Query exceeded time limit"],
+        )
+
+        assert results == [
+            BenchmarkResult("8.8.8.8", "google.com", 45.5, True, None),
+            BenchmarkResult(
+                "1.1.1.1", "invalid.test", 0.0, False,
+                "Timeout: Query exceeded time limit",
+            ),
+        ]
+
+    def test_from_arrays_accepts_numpy_columns(self):
+        """Test bulk construction from numpy unicode/float/bool arrays."""
+        results = BenchmarkResult.from_arrays(
+            providers=np.array(["8.8.8.8", "1.1.1.1"]),
+            domains=np.array(["google.com", "github.com"]),
+            latency_ms=np.array([45.5, 30.0]),
+            success=np.array([True, True]),
+        )
+
+        assert len(results) == 2
+        assert results[0].provider == "8.8.8.8"
+        assert results[1].provider == "1.1.1.1"
+        assert results[0].latency_ms == 45.5
+
+    def test_from_arrays_defaults_error_to_none(self):
+        """Test that omitting the error column yields error=None."""
+        results = BenchmarkResult.from_arrays(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+            latency_ms=[45.5],
+            success=[True],
+        )
+
+        assert len(results) == 1
+        assert results[0].error is None
+
+
+class TestBenchmarkResults:
+    """Test the BenchmarkResults SoA container."""
+
+    def test_packs_results_into_arrays(self):
+        """Test that fields land in parallel column arrays."""
+        results = [
+            BenchmarkResult("8.8.8.8", "a.com", 10.0, True),
+            BenchmarkResult("8.8.8.8", "b.com", 30.0, True),
+            BenchmarkResult("1.1.1.1", "a.com", 0.0, False, error="Timeout"),
+        ]
+
+        batch = BenchmarkResults(results)
+
+        assert len(batch) == 3
+        assert list(batch.providers) == ["8.8.8.8", "8.8.8.8", "1.1.1.1"]
+        assert list(batch.latency_ms) == [10.0, 30.0, 0.0]
+        assert list(batch.success) == [True, True, False]
+
+    def test_summary_over_successful_queries(self):
+        """Test that summary statistics skip failed queries."""
+        results = [
+            BenchmarkResult("8.8.8.8", "a.com", 10.0, True),
+            BenchmarkResult("8.8.8.8", "b.com", 30.0, True),
+            BenchmarkResult("1.1.1.1", "a.com", 0.0, False, error="Timeout"),
+        ]
+
+        summary = BenchmarkResults(results).summary()
+
+        assert summary["count"] == 3
+        assert summary["success_rate"] == pytest.approx(200 / 3)
+        assert summary["mean_latency_ms"] == pytest.approx(20.0)
+        assert summary["p50_latency_ms"] == pytest.approx(20.0)
+
+    def test_summary_empty(self):
+        """Test summary on an empty batch."""
+        summary = BenchmarkResults([]).summary()
+
+        assert summary["count"] == 0
+        assert summary["success_rate"] == 0.0
+        assert summary["mean_latency_ms"] == 0.0
+
 
 class TestBenchmarkRunner:
     """Test BenchmarkRunner class."""
@@ -78,15 +208,10 @@ class TestBenchmarkRunner:
         )
         assert runner.iterations == 1
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
-    def test_query_dns_success(self, mock_resolver_class):
+    @patch("dns_bench.benchmark.dns.resolver.Resolver", new=FakeResolver)
+    def test_query_dns_success(self):
         """Test successful DNS query."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
-        mock_answer = MagicMock()
-        mock_answer.rrset = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
+        FakeResolver.raises = None
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -99,12 +224,10 @@ class TestBenchmarkRunner:
         assert error is None
         assert latency >= 0.0
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
-    def test_query_dns_timeout(self, mock_resolver_class):
+    @patch("dns_bench.benchmark.dns.resolver.Resolver", new=FakeResolver)
+    def test_query_dns_timeout(self):
         """Test DNS query timeout handling."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = dns.exception.Timeout()
+        FakeResolver.raises = dns.exception.Timeout()
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -117,12 +240,27 @@ class TestBenchmarkRunner:
         assert "Timeout" in error
         assert latency >= 0.0
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
-    def test_query_dns_nxdomain(self, mock_resolver_class):
+    @patch("dns_bench.benchmark.dns.resolver.Resolver", new=FakeResolver)
+    def test_query_dns_lifetime_timeout(self):
+        """Test that Timeout subclasses get the Timeout label."""
+        FakeResolver.raises = dns.resolver.LifetimeTimeout(
+            timeout=5.0, errors=[]
+        )
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+        )
+
+        latency, success, error = runner._query_dns("8.8.8.8", "google.com")
+
+        assert success is False
+        assert error == "Timeout: Query exceeded time limit"
+
+    @patch("dns_bench.benchmark.dns.resolver.Resolver", new=FakeResolver)
+    def test_query_dns_nxdomain(self):
         """Test DNS query with non-existent domain."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = dns.resolver.NXDOMAIN()
+        FakeResolver.raises = dns.resolver.NXDOMAIN()
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -135,12 +273,10 @@ class TestBenchmarkRunner:
         assert "NXDOMAIN" in error
         assert latency >= 0.0
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
-    def test_query_dns_no_answer(self, mock_resolver_class):
+    @patch("dns_bench.benchmark.dns.resolver.Resolver", new=FakeResolver)
+    def test_query_dns_no_answer(self):
         """Test DNS query with no answer."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = dns.resolver.NoAnswer()
+        FakeResolver.raises = dns.resolver.NoAnswer()
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -153,12 +289,10 @@ class TestBenchmarkRunner:
         assert "NoAnswer" in error
         assert latency >= 0.0
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
-    def test_query_dns_no_nameservers(self, mock_resolver_class):
+    @patch("dns_bench.benchmark.dns.resolver.Resolver", new=FakeResolver)
+    def test_query_dns_no_nameservers(self):
         """Test DNS query with no nameservers."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = dns.resolver.NoNameservers()
+        FakeResolver.raises = dns.resolver.NoNameservers()
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -171,12 +305,10 @@ class TestBenchmarkRunner:
         assert "NoNameservers" in error
         assert latency >= 0.0
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
-    def test_query_dns_generic_exception(self, mock_resolver_class):
+    @patch("dns_bench.benchmark.dns.resolver.Resolver", new=FakeResolver)
+    def test_query_dns_generic_exception(self):
         """Test DNS query with generic exception."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = Exception("Test error")
+        FakeResolver.raises = Exception("Test error")
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -189,7 +321,7 @@ class TestBenchmarkRunner:
         assert "Test error" in error
         assert latency >= 0.0
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
     def test_run_single_provider_domain(self, mock_resolver_class):
         """Test running benchmark with single provider and domain."""
         mock_resolver = MagicMock()
@@ -197,7 +329,7 @@ class TestBenchmarkRunner:
 
         mock_answer = MagicMock()
         mock_answer.rrset = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
+        mock_resolver.resolve = AsyncMock(return_value=mock_answer)
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -213,7 +345,7 @@ class TestBenchmarkRunner:
         assert results[0].success is True
         assert results[0].error is None
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
     def test_run_multiple_providers(self, mock_resolver_class):
         """Test running benchmark with multiple providers."""
         mock_resolver = MagicMock()
@@ -221,7 +353,7 @@ class TestBenchmarkRunner:
 
         mock_answer = MagicMock()
         mock_answer.rrset = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
+        mock_resolver.resolve = AsyncMock(return_value=mock_answer)
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8", "1.1.1.1"],
@@ -236,7 +368,7 @@ class TestBenchmarkRunner:
         assert "8.8.8.8" in providers_in_results
         assert "1.1.1.1" in providers_in_results
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
     def test_run_multiple_domains(self, mock_resolver_class):
         """Test running benchmark with multiple domains."""
         mock_resolver = MagicMock()
@@ -244,7 +376,7 @@ class TestBenchmarkRunner:
 
         mock_answer = MagicMock()
         mock_answer.rrset = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
+        mock_resolver.resolve = AsyncMock(return_value=mock_answer)
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -259,7 +391,7 @@ class TestBenchmarkRunner:
         assert "google.com" in domains_in_results
         assert "github.com" in domains_in_results
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
     def test_run_multiple_iterations(self, mock_resolver_class):
         """Test running benchmark with multiple iterations."""
         mock_resolver = MagicMock()
@@ -267,7 +399,7 @@ class TestBenchmarkRunner:
 
         mock_answer = MagicMock()
         mock_answer.rrset = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
+        mock_resolver.resolve = AsyncMock(return_value=mock_answer)
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8"],
@@ -282,7 +414,7 @@ class TestBenchmarkRunner:
             assert result.provider == "8.8.8.8"
             assert result.domain == "google.com"
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
     def test_run_complex_scenario(self, mock_resolver_class):
         """Test running benchmark with multiple providers, domains, and iterations."""
         mock_resolver = MagicMock()
@@ -290,7 +422,7 @@ class TestBenchmarkRunner:
 
         mock_answer = MagicMock()
         mock_answer.rrset = [MagicMock()]
-        mock_resolver.resolve.return_value = mock_answer
+        mock_resolver.resolve = AsyncMock(return_value=mock_answer)
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8", "1.1.1.1"],
@@ -309,7 +441,7 @@ class TestBenchmarkRunner:
             assert isinstance(result.latency_ms, float)
             assert isinstance(result.success, bool)
 
-    @patch("dns_bench.benchmark.dns.resolver.Resolver")
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
     def test_run_mixed_success_failure(self, mock_resolver_class):
         """Test running benchmark with mixed success and failure."""
         mock_resolver = MagicMock()
@@ -323,7 +455,7 @@ class TestBenchmarkRunner:
             dns.exception.Timeout(),
             mock_answer,
         ]
-        mock_resolver.resolve.side_effect = side_effects
+        mock_resolver.resolve = AsyncMock(side_effect=side_effects)
 
         runner = BenchmarkRunner(
             providers=["8.8.8.8", "1.1.1.1"],
@@ -339,6 +471,248 @@ class TestBenchmarkRunner:
         assert success_count >= 1
         assert failure_count >= 1
 
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
+    def test_run_retries_failed_queries(self, mock_resolver_class):
+        """Test that failed queries are retried up to the configured count."""
+        mock_resolver = MagicMock()
+        mock_resolver_class.return_value = mock_resolver
+
+        mock_answer = MagicMock()
+        mock_answer.rrset = [MagicMock()]
+        mock_resolver.resolve = AsyncMock(
+            side_effect=[dns.exception.Timeout(), mock_answer]
+        )
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+            retries=1,
+        )
+
+        results = runner.run()
+
+        assert len(results) == 1
+        assert results[0].success is True
+        assert mock_resolver.resolve.await_count == 2
+
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
+    def test_run_no_retries_by_default(self, mock_resolver_class):
+        """Test that failures are not retried unless requested."""
+        mock_resolver = MagicMock()
+        mock_resolver_class.return_value = mock_resolver
+        mock_resolver.resolve = AsyncMock(side_effect=dns.exception.Timeout())
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+        )
+
+        results = runner.run()
+
+        assert len(results) == 1
+        assert results[0].success is False
+        assert mock_resolver.resolve.await_count == 1
+
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
+    def test_run_use_cache_skips_repeat_queries(self, mock_resolver_class):
+        """Test that use_cache reuses answers for repeat queries within TTL."""
+        mock_resolver = MagicMock()
+        mock_resolver_class.return_value = mock_resolver
+
+        mock_answer = MagicMock()
+        mock_answer.rrset = MagicMock(ttl=300)
+        mock_resolver.resolve = AsyncMock(return_value=mock_answer)
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+            iterations=3,
+            use_cache=True,
+        )
+
+        results = runner.run()
+
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert mock_resolver.resolve.await_count == 1
+
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
+    def test_run_cache_disabled_by_default(self, mock_resolver_class):
+        """Test that every iteration hits the network without use_cache."""
+        mock_resolver = MagicMock()
+        mock_resolver_class.return_value = mock_resolver
+
+        mock_answer = MagicMock()
+        mock_answer.rrset = MagicMock(ttl=300)
+        mock_resolver.resolve = AsyncMock(return_value=mock_answer)
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+            iterations=3,
+        )
+
+        results = runner.run()
+
+        assert len(results) == 3
+        assert mock_resolver.resolve.await_count == 3
+
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
+    def test_run_replicated_records_fastest_provider(self, mock_resolver_class):
+        """Test that replicated mode keeps only the first provider to answer."""
+        mock_answer = MagicMock()
+        mock_answer.rrset = [MagicMock()]
+
+        async def slow_resolve(*args, **kwargs):
+            await asyncio.sleep(0.2)
+            return mock_answer
+
+        slow_resolver = MagicMock()
+        slow_resolver.resolve = slow_resolve
+        fast_resolver = MagicMock()
+        fast_resolver.resolve = AsyncMock(return_value=mock_answer)
+        mock_resolver_class.side_effect = [slow_resolver, fast_resolver]
+
+        runner = BenchmarkRunner(
+            providers=["1.1.1.1", "8.8.8.8"],
+            domains=["google.com"],
+        )
+
+        results = runner.run_replicated()
+
+        assert len(results) == 1
+        assert results[0].provider == "8.8.8.8"
+        assert results[0].success is True
+
+    def test_run_replicated_no_providers(self):
+        """Test that replicated mode returns no results without providers."""
+        runner = BenchmarkRunner(
+            providers=[],
+            domains=["google.com"],
+        )
+
+        assert runner.run_replicated() == []
+
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
+    def test_run_replicated_waits_for_success_past_fast_failure(self, mock_resolver_class):
+        """Test that an instant failure does not beat a slower success."""
+        mock_answer = MagicMock()
+        mock_answer.rrset = [MagicMock()]
+
+        async def slow_resolve(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return mock_answer
+
+        failing_resolver = MagicMock()
+        failing_resolver.resolve = AsyncMock(side_effect=dns.resolver.NXDOMAIN())
+        slow_resolver = MagicMock()
+        slow_resolver.resolve = slow_resolve
+        mock_resolver_class.side_effect = [failing_resolver, slow_resolver]
+
+        runner = BenchmarkRunner(
+            providers=["1.1.1.1", "8.8.8.8"],
+            domains=["google.com"],
+        )
+
+        results = runner.run_replicated()
+
+        assert len(results) == 1
+        assert results[0].provider == "8.8.8.8"
+        assert results[0].success is True
+
+    @patch("dns_bench.benchmark.dns.asyncresolver.Resolver")
+    def test_run_dedupe_collapses_concurrent_queries(self, mock_resolver_class):
+        """Test that dedupe shares one in-flight lookup per (provider, domain)."""
+        mock_resolver = MagicMock()
+        mock_resolver_class.return_value = mock_resolver
+
+        mock_answer = MagicMock()
+        mock_answer.rrset = [MagicMock()]
+        call_count = 0
+
+        async def counted_resolve(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return mock_answer
+
+        mock_resolver.resolve = counted_resolve
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+            iterations=3,
+            dedupe=True,
+        )
+
+        results = runner.run()
+
+        assert len(results) == 3
+        assert all(r.success for r in results)
+        assert call_count == 1
+
+    def test_run_adaptive_stops_on_stable_latency(self):
+        """Test that adaptive mode stops at min_iterations for stable pairs."""
+        record = ("8.8.8.8", "google.com", 10.0, True, None)
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+        )
+
+        with patch.object(
+            BenchmarkRunner, "_run_job", AsyncMock(return_value=record)
+        ) as mock_job:
+            results = runner.run_adaptive(
+                min_iterations=5, max_iterations=50, ci_target=0.05
+            )
+
+        assert len(results) == 5
+        assert mock_job.await_count == 5
+        assert all(r.latency_ms == 10.0 for r in results)
+
+    def test_run_adaptive_keeps_sampling_noisy_latency(self):
+        """Test that adaptive mode runs to max_iterations when latency is noisy."""
+        latencies = iter([1.0, 200.0] * 50)
+
+        async def noisy_job(self, provider, domain):
+            return (provider, domain, next(latencies), True, None)
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8"],
+            domains=["google.com"],
+        )
+
+        with patch.object(BenchmarkRunner, "_run_job", noisy_job):
+            results = runner.run_adaptive(
+                min_iterations=5, max_iterations=20, ci_target=0.05
+            )
+
+        assert len(results) == 20
+
+    @patch("dns_bench.benchmark.dns.resolver.Resolver")
+    def test_run_sync_uses_thread_pool(self, mock_resolver_class):
+        """Test that run_sync covers every pair without an event loop."""
+        mock_resolver = MagicMock()
+        mock_resolver_class.return_value = mock_resolver
+        mock_answer = MagicMock()
+        mock_answer.rrset = [MagicMock()]
+        mock_resolver.resolve.return_value = mock_answer
+
+        runner = BenchmarkRunner(
+            providers=["8.8.8.8", "1.1.1.1"],
+            domains=["google.com"],
+            iterations=2,
+            concurrency=4,
+        )
+
+        results = runner.run_sync()
+
+        assert len(results) == 4
+        assert all(r.success for r in results)
+        assert mock_resolver.resolve.call_count == 4
+        assert {r.provider for r in results} == {"8.8.8.8", "1.1.1.1"}
+
 
 class TestRunBenchmarkFunction:
     """Test run_benchmark convenience function."""
@@ -399,5 +773,6 @@ class TestRunBenchmarkFunction:
             domains=["google.com", "github.com"],
             timeout=3.0,
             iterations=5,
+            retries=0,
         )
         mock_runner.run.assert_called_once()
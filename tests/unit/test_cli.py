@@ -0,0 +1,36 @@
+"""Tests for the CLI entry point."""
+
+import subprocess
+import sys
+
+
+def test_cli_import_skips_heavy_dependencies():
+    """Importing dns_bench.cli must not pull in dnspython, numpy, or msgspec.
+
+    Those imports are deferred into the command bodies so `--help` and
+    `version` start fast; run the check in a fresh interpreter because the
+    test process itself has long since imported them.
+    """
+    code = (
+        "import sys; import dns_bench.cli; "
+        "heavy = [m for m in ('dns', 'numpy', 'msgspec') if m in sys.modules]; "
+        "assert not heavy, f'heavy modules imported: {heavy}'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=30)
+
+
+def test_cli_version_command_skips_heavy_dependencies():
+    """Invoking `version` must not load the config or its parsers.
+
+    The config file is loaded lazily by the commands that read it, so a
+    version invocation should finish without importing msgspec or yaml.
+    """
+    code = (
+        "import sys; from click.testing import CliRunner; "
+        "from dns_bench.cli import app; "
+        "result = CliRunner().invoke(app, ['version']); "
+        "assert result.exit_code == 0, result.output; "
+        "heavy = [m for m in ('dns', 'numpy', 'msgspec', 'yaml') if m in sys.modules]; "
+        "assert not heavy, f'heavy modules imported: {heavy}'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, timeout=30)
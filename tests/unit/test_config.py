@@ -57,3 +57,40 @@ def test_config_with_providers_and_domains():
     assert len(config.domains) == 1
     assert config.providers[0].name == "Google"
     assert config.domains[0].name == "example.com"
+
+
+def test_loader_writes_yaml_cache_sidecar(tmp_path):
+    """Loading a YAML config creates an mtime-keyed JSON cache next to it."""
+    from dns_bench.config.loader import load_config
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("version: '2.0.0'\n")
+
+    config = load_config(str(config_file))
+
+    assert config.version == "2.0.0"
+    assert (tmp_path / "config.yaml.cache.json").exists()
+
+
+def test_loader_reuses_cache_until_config_changes(tmp_path):
+    """A fresh cache is served as-is; touching the config invalidates it."""
+    from dns_bench.config.loader import load_config
+    import json
+    import os
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("version: '2.0.0'\n")
+    load_config(str(config_file))
+
+    cache_file = tmp_path / "config.yaml.cache.json"
+    cached = json.loads(cache_file.read_text())
+    cached["data"]["version"] = "9.9.9"
+    cache_file.write_text(json.dumps(cached))
+
+    # Cache still matches the config's mtime, so the doctored value is used.
+    assert load_config(str(config_file)).version == "9.9.9"
+
+    # Rewriting the config bumps its mtime and forces a re-parse.
+    config_file.write_text("version: '3.0.0'\n")
+    os.utime(config_file, ns=(0, cached["mtime_ns"] + 1))
+    assert load_config(str(config_file)).version == "3.0.0"
@@ -0,0 +1,99 @@
+"""Tests for result exporters."""
+
+import csv
+import json
+
+import pytest
+
+from dns_bench.benchmark import BenchmarkResult
+from dns_bench.exporters import export_csv, export_json, export_results
+
+
+def _sample_results():
+    return [
+        BenchmarkResult(
+            provider="8.8.8.8",
+            domain="google.com",
+            latency_ms=45.5,
+            success=True,
+            error=None,
+        ),
+        BenchmarkResult(
+            provider="1.1.1.1",
+            domain="github.com",
+            latency_ms=0.0,
+            success=False,
+            error="Timeout: Query exceeded time limit",
+        ),
+    ]
+
+
+class TestExportCsv:
+    """Test CSV export."""
+
+    def test_export_csv_writes_header_and_rows(self, tmp_path):
+        """Test that CSV export writes a header row plus one row per result."""
+        path = tmp_path / "results.csv"
+        export_csv(_sample_results(), path)
+
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == ["provider", "domain", "latency_ms", "success", "error"]
+        assert len(rows) == 3
+        assert rows[1][0] == "8.8.8.8"
+        assert rows[2][0] == "1.1.1.1"
+
+    def test_export_csv_empty_results(self, tmp_path):
+        """Test CSV export with no results."""
+        path = tmp_path / "results.csv"
+        export_csv([], path)
+
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert len(rows) == 1
+
+
+class TestExportJson:
+    """Test JSON export."""
+
+    def test_export_json_round_trip(self, tmp_path):
+        """Test that JSON export produces parseable output."""
+        path = tmp_path / "results.json"
+        export_json(_sample_results(), path)
+
+        payload = json.loads(path.read_text())
+
+        assert len(payload) == 2
+        assert payload[0]["provider"] == "8.8.8.8"
+        assert payload[0]["success"] is True
+        assert payload[1]["error"] == "Timeout: Query exceeded time limit"
+
+    def test_export_json_empty_results(self, tmp_path):
+        """Test JSON export with no results."""
+        path = tmp_path / "results.json"
+        export_json([], path)
+
+        assert json.loads(path.read_text()) == []
+
+
+class TestExportResults:
+    """Test extension-based dispatch."""
+
+    def test_export_results_json(self, tmp_path):
+        """Test dispatch to JSON by extension."""
+        path = tmp_path / "out.json"
+        export_results(_sample_results(), path)
+        assert len(json.loads(path.read_text())) == 2
+
+    def test_export_results_csv(self, tmp_path):
+        """Test dispatch to CSV by extension."""
+        path = tmp_path / "out.csv"
+        export_results(_sample_results(), path)
+        assert path.read_text().startswith("provider,")
+
+    def test_export_results_unsupported_extension(self, tmp_path):
+        """Test that unsupported extensions raise ValueError."""
+        with pytest.raises(ValueError):
+            export_results(_sample_results(), tmp_path / "out.txt")
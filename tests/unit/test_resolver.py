@@ -31,6 +31,11 @@ class TestIPValidation:
         assert _is_valid_ip("::1") is True
         assert _is_valid_ip("fe80::1") is True
 
+    def test_valid_ipv6_with_zone(self):
+        """Test zone-scoped IPv6 addresses as reported by ipconfig."""
+        assert _is_valid_ip("fe80::1%eth0") is True
+        assert _is_valid_ip("fec0:0:0:ffff::1%1") is True
+
     def test_invalid_ip(self):
         """Test invalid IP addresses."""
         assert _is_valid_ip("999.999.999.999") is False
@@ -38,6 +43,7 @@ class TestIPValidation:
         assert _is_valid_ip("") is False
         assert _is_valid_ip("192.168.1") is False
         assert _is_valid_ip("192.168.1.1.1") is False
+        assert _is_valid_ip("fe80::1%") is False
 
 
 class TestLinuxResolvers:
@@ -123,7 +129,7 @@ resolver #3
 """
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = scutil_output
+        mock_result.stdout = scutil_output.encode()
 
         with patch("subprocess.run", return_value=mock_result):
             resolvers = _parse_macos_resolvers()
@@ -147,7 +153,7 @@ resolver #3
         """Test when scutil command returns non-zero exit code."""
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
+        mock_result.stdout = b""
 
         with patch("subprocess.run", return_value=mock_result):
             resolvers = _parse_macos_resolvers()
@@ -183,7 +189,7 @@ Ethernet adapter Ethernet:
 """
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = ipconfig_output
+        mock_result.stdout = ipconfig_output.encode()
 
         with patch("subprocess.run", return_value=mock_result):
             resolvers = _parse_windows_resolvers()
@@ -205,7 +211,7 @@ Ethernet adapter Ethernet:
         """Test when ipconfig command returns non-zero exit code."""
         mock_result = MagicMock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
+        mock_result.stdout = b""
 
         with patch("subprocess.run", return_value=mock_result):
             resolvers = _parse_windows_resolvers()
@@ -243,12 +249,29 @@ class TestDeduplication:
 class TestGetLocalResolvers:
     """Test main get_local_resolvers function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_detection_cache(self):
+        """Isolate each test from the process-wide detection cache."""
+        get_local_resolvers.cache_clear()
+        yield
+        get_local_resolvers.cache_clear()
+
+    def test_get_local_resolvers_caches_detection(self):
+        """Repeated calls reuse the first detection result."""
+        resolv_conf_content = "nameserver 8.8.8.8\n"
+        with patch("sys.platform", "linux"):
+            with patch("pathlib.Path.exists", return_value=True):
+                with patch("builtins.open", mock_open(read_data=resolv_conf_content)) as m:
+                    assert get_local_resolvers() == ["8.8.8.8"]
+                    assert get_local_resolvers() == ["8.8.8.8"]
+                    assert m.call_count == 1
+
     def test_get_local_resolvers_linux(self):
         """Test get_local_resolvers on Linux."""
         resolv_conf_content = """nameserver 8.8.8.8
 nameserver 8.8.4.4
 """
-        with patch("platform.system", return_value="Linux"):
+        with patch("sys.platform", "linux"):
             with patch("pathlib.Path.exists", return_value=True):
                 with patch("builtins.open", mock_open(read_data=resolv_conf_content)):
                     resolvers = get_local_resolvers()
@@ -262,9 +285,9 @@ nameserver 8.8.4.4
 """
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = scutil_output
+        mock_result.stdout = scutil_output.encode()
 
-        with patch("platform.system", return_value="Darwin"):
+        with patch("sys.platform", "darwin"):
             with patch("subprocess.run", return_value=mock_result):
                 resolvers = get_local_resolvers()
                 assert "1.1.1.1" in resolvers
@@ -274,29 +297,31 @@ nameserver 8.8.4.4
         ipconfig_output = "DNS Servers . . . . . . . . . . . : 8.8.8.8"
         mock_result = MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = ipconfig_output
+        mock_result.stdout = ipconfig_output.encode()
 
-        with patch("platform.system", return_value="Windows"):
+        with patch("sys.platform", "win32"):
             with patch("subprocess.run", return_value=mock_result):
                 resolvers = get_local_resolvers()
                 assert "8.8.8.8" in resolvers
 
     def test_get_local_resolvers_fallback(self):
         """Test fallback to 127.0.0.1 when detection fails."""
-        with patch("platform.system", return_value="Linux"):
+        with patch("sys.platform", "linux"):
             with patch("pathlib.Path.exists", return_value=False):
                 resolvers = get_local_resolvers()
                 assert resolvers == ["127.0.0.1"]
 
     def test_get_local_resolvers_unsupported_os(self):
         """Test fallback on unsupported OS."""
-        with patch("platform.system", return_value="UnknownOS"):
+        with patch("sys.platform", "sunos5"):
             resolvers = get_local_resolvers()
             assert resolvers == ["127.0.0.1"]
 
     def test_get_local_resolvers_exception_handling(self):
         """Test that exceptions are caught and fallback is returned."""
-        with patch("platform.system", side_effect=Exception("Unexpected error")):
+        with patch(
+            "dns_bench.resolver._detect_resolvers", side_effect=Exception("Unexpected error")
+        ):
             resolvers = get_local_resolvers()
             assert resolvers == ["127.0.0.1"]
 
@@ -306,7 +331,7 @@ nameserver 8.8.4.4
 nameserver 8.8.8.8
 nameserver 1.1.1.1
 """
-        with patch("platform.system", return_value="Linux"):
+        with patch("sys.platform", "linux"):
             with patch("pathlib.Path.exists", return_value=True):
                 with patch("builtins.open", mock_open(read_data=resolv_conf_content)):
                     resolvers = get_local_resolvers()
@@ -314,7 +339,7 @@ nameserver 1.1.1.1
 
     def test_get_local_resolvers_returns_list(self):
         """Test that get_local_resolvers always returns a list."""
-        with patch("platform.system", return_value="Linux"):
+        with patch("sys.platform", "linux"):
             with patch("pathlib.Path.exists", return_value=False):
                 resolvers = get_local_resolvers()
                 assert isinstance(resolvers, list)
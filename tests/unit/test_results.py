@@ -2,6 +2,8 @@
 
 from io import StringIO
 
+import numpy as np
+import pytest
 from rich.console import Console
 
 from dns_bench.benchmark import BenchmarkResult
@@ -344,6 +346,115 @@ class TestResultsAnalyzer:
 
         assert metrics[0].provider == "1.1.1.1"
 
+    def test_latency_percentiles(self):
+        """Test per-provider latency percentile computation."""
+        results = [
+            BenchmarkResult(
+                provider="8.8.8.8",
+                domain="google.com",
+                latency_ms=float(latency),
+                success=True,
+                error=None,
+            )
+            for latency in range(1, 101)
+        ]
+        analyzer = ResultsAnalyzer(results)
+        percentiles = analyzer.latency_percentiles()
+
+        assert "8.8.8.8" in percentiles
+        assert percentiles["8.8.8.8"][50.0] == 50.5
+        assert percentiles["8.8.8.8"][95.0] > percentiles["8.8.8.8"][50.0]
+
+    def test_latency_percentiles_skips_failed_queries(self):
+        """Test that failed queries are excluded from percentiles."""
+        results = [
+            BenchmarkResult(
+                provider="8.8.8.8",
+                domain="google.com",
+                latency_ms=40.0,
+                success=True,
+                error=None,
+            ),
+            BenchmarkResult(
+                provider="8.8.8.8",
+                domain="invalid.test",
+                latency_ms=5000.0,
+                success=False,
+                error="Timeout",
+            ),
+            BenchmarkResult(
+                provider="1.1.1.1",
+                domain="invalid.test",
+                latency_ms=0.0,
+                success=False,
+                error="Timeout",
+            ),
+        ]
+        analyzer = ResultsAnalyzer(results)
+        percentiles = analyzer.latency_percentiles()
+
+        assert percentiles["8.8.8.8"][50.0] == 40.0
+        assert "1.1.1.1" not in percentiles
+
+    def test_latency_percentiles_empty(self):
+        """Test percentiles with no results."""
+        analyzer = ResultsAnalyzer([])
+        assert analyzer.latency_percentiles() == {}
+
+    def test_percentile_reuses_sorted_cache(self):
+        """Test single-provider percentile queries and their sorted cache."""
+        results = [
+            BenchmarkResult(
+                provider="8.8.8.8",
+                domain="google.com",
+                latency_ms=float(latency),
+                success=True,
+                error=None,
+            )
+            for latency in range(1, 101)
+        ]
+        analyzer = ResultsAnalyzer(results)
+
+        p50 = analyzer.percentile("8.8.8.8", 50.0)
+        p95 = analyzer.percentile("8.8.8.8", 95.0)
+
+        assert p50 == analyzer.latency_percentiles()["8.8.8.8"][50.0]
+        assert p50 == 50.5
+        assert p95 > p50
+        assert "8.8.8.8" in analyzer._sorted_cache
+
+    def test_percentile_no_successful_samples(self):
+        """Test that percentile raises for a provider with only failures."""
+        results = [
+            BenchmarkResult(
+                provider="8.8.8.8",
+                domain="invalid.test",
+                latency_ms=5000.0,
+                success=False,
+                error="Timeout",
+            )
+        ]
+        analyzer = ResultsAnalyzer(results)
+
+        with pytest.raises(ValueError):
+            analyzer.percentile("8.8.8.8", 50.0)
+
+    def test_from_columns_matches_list_constructor(self):
+        """Test that column-based construction analyzes like the list path."""
+        analyzer = ResultsAnalyzer.from_columns(
+            providers=np.array(["8.8.8.8", "1.1.1.1", "8.8.8.8"], dtype=object),
+            latency_ms=np.array([40.0, 20.0, 60.0]),
+            success=np.array([True, True, False]),
+        )
+        metrics = analyzer.analyze()
+
+        assert len(metrics) == 2
+        assert metrics[0].provider == "1.1.1.1"
+        assert metrics[1].provider == "8.8.8.8"
+        assert metrics[1].avg_latency == 50.0
+        assert metrics[1].success_rate == 50.0
+        assert metrics[1].sample_count == 2
+
 
 class TestDisplayResults:
     """Test display_results function."""
@@ -352,7 +463,7 @@ class TestDisplayResults:
         """Test displaying empty results list."""
         results = []
         string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True)
+        console = Console(file=string_io, force_terminal=False, no_color=True, width=200)
 
         display_results(results, console=console)
 
@@ -371,7 +482,7 @@ class TestDisplayResults:
             )
         ]
         string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True)
+        console = Console(file=string_io, force_terminal=False, no_color=True, width=200)
 
         display_results(results, console=console)
 
@@ -402,7 +513,7 @@ class TestDisplayResults:
             ),
         ]
         string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True)
+        console = Console(file=string_io, force_terminal=False, no_color=True, width=200)
 
         display_results(results, console=console)
 
@@ -444,7 +555,7 @@ class TestDisplayResults:
             ),
         ]
         string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True)
+        console = Console(file=string_io, force_terminal=False, no_color=True, width=200)
 
         display_results(results, console=console)
 
@@ -487,7 +598,7 @@ class TestDisplayResults:
             ),
         ]
         string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True)
+        console = Console(file=string_io, force_terminal=False, no_color=True, width=200)
 
         display_results(results, console=console)
 
@@ -509,7 +620,7 @@ class TestDisplayResults:
             )
         ]
         string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True)
+        console = Console(file=string_io, force_terminal=False, no_color=True, width=200)
 
         display_results(results, console=console)
 